@@ -1,154 +1,304 @@
 import numpy as np
-from flask import Flask, request, jsonify, send_from_directory, send_file
+import orjson
+from numba import njit
+from flask import Flask, Response, request, jsonify, send_from_directory, send_file
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
+import concurrent.futures
+import functools
+import hashlib
 import logging
+import math
+import multiprocessing
 import os
+import threading
+
+# Sorted keys match the output of Flask's default provider
+ORJSON_OPTIONS = (orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+                  | orjson.OPT_SORT_KEYS)
+
+# Eigenvalues whose imaginary part is within this fraction of the largest
+# matrix entry are reported as real; relative so that scaled-down rotations
+# keep their complex pair
+IMAG_TOLERANCE = 1e-10
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson, which also serializes NumPy types natively"""
+    
+    def dumps(self, obj, **kwargs):
+        # orjson only indents by two spaces, so any indent (as passed by
+        # response() in debug mode) maps to OPT_INDENT_2
+        option = ORJSON_OPTIONS
+        if not kwargs.get('sort_keys', self.sort_keys):
+            option &= ~orjson.OPT_SORT_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(
+            obj,
+            option=option,
+            default=kwargs.get('default', self.default)
+        ).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
 
 app = Flask(__name__, static_folder='../dist', static_url_path='')
+app.json = OrjsonProvider(app)
 CORS(app)
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+@njit(cache=True)
+def _eigvec2x2(b, c, shift_a, shift_d, fallback_x, fallback_y):
+    """
+    Unit null vector of (A - val*I) for a real eigenvalue of [[a, b], [c, d]],
+    given shift_a = val - a and shift_d = val - d
+    """
+    # Rows of (A - lambda*I) give two candidate null vectors;
+    # take the larger one for numerical stability
+    n1 = math.hypot(b, shift_a)
+    n2 = math.hypot(shift_d, c)
+    if n1 >= n2 and n1 > 1e-10:
+        return b / n1, shift_a / n1
+    if n2 > 1e-10:
+        return shift_d / n2, c / n2
+    # A is a multiple of the identity, every vector is an eigenvector
+    return fallback_x, fallback_y
+
+@njit(cache=True)
+def _eig2x2(a, b, c, d):
+    """
+    Closed-form eigendecomposition of [[a, b], [c, d]] from the characteristic
+    polynomial lambda^2 - tr*lambda + det = 0
+    Returns (l1_re, l1_im, l2_re, l2_im, v1x, v1y_re, v1y_im, v2x, v2y_re, v2y_im);
+    the x component of both eigenvectors is always real
+    """
+    tr = a + d
+    # (a - d)^2 + 4bc equals tr^2 - 4det without the cancellation when the
+    # eigenvalues are close, and is exactly >= 0 whenever b*c >= 0
+    diff = a - d
+    disc = diff * diff + 4 * b * c
+    
+    if disc >= 0:
+        s = math.sqrt(disc)
+        l1 = (tr + s) / 2
+        l2 = (tr - s) / 2
+        # lambda - a and lambda - d formed directly rather than by subtraction
+        v1x, v1y = _eigvec2x2(b, c, (s - diff) / 2, (s + diff) / 2, 1.0, 0.0)
+        v2x, v2y = _eigvec2x2(b, c, -(s + diff) / 2, -(s - diff) / 2, 0.0, 1.0)
+        return l1, 0.0, l2, 0.0, v1x, v1y, 0.0, v2x, v2y, 0.0
+    
+    # Complex conjugate pair; disc < 0 implies b*c < 0, so b != 0.
+    # Eigenvector (b, lambda - a), normalized to unit complex norm
+    real = tr / 2
+    s = math.sqrt(-disc) / 2
+    shift_a = -diff / 2
+    norm = math.sqrt(b * b + shift_a * shift_a + s * s)
+    return (real, s, real, -s,
+            b / norm, shift_a / norm, s / norm,
+            b / norm, shift_a / norm, -s / norm)
+
+# Compile at import so the first request does not pay the JIT cost. Importing
+# numba adds roughly half a second to start-up, but start.py imports this
+# module once in the gunicorn master before forking, so workers share it;
+# in exchange each 2x2 request saves the interpreter cost of the kernel
+_eig2x2(1.0, 0.0, 0.0, 1.0)
+
 class EigenCalculator:
     """Handles eigenvalue and eigenvector calculations using NumPy"""
     
     @staticmethod
-    def calculate_eigenvalues_2d(matrix):
+    def _build_results(eigenvalues, eigenvectors, determinants, traces, scales):
         """
-        Calculate eigenvalues and eigenvectors for a 2x2 matrix
-        Returns both real and complex eigenvalues/eigenvectors
+        Build response dicts for a stack of decompositions
+        eigenvalues is (N, d) and eigenvectors (N, d, d) with eigenvectors as
+        columns; classification and normalization run once over the whole
+        stack, leaving only the dict assembly per matrix. Rows are left as
+        C-contiguous NumPy views for orjson to serialize
         """
-        try:
-            matrix = np.array(matrix, dtype=float)
-            if matrix.shape != (2, 2):
-                raise ValueError("Matrix must be 2x2")
-            
-            eigenvalues, eigenvectors = np.linalg.eig(matrix)
-            
+        is_real = np.abs(eigenvalues.imag) <= IMAG_TOLERANCE * np.asarray(scales)[:, np.newaxis]
+        all_real = is_real.all(axis=1).tolist()
+        
+        # Rows of vecs are eigenvectors; normalize all of their real parts at once
+        vecs_real = np.ascontiguousarray(eigenvectors.real.transpose(0, 2, 1))
+        norms = np.linalg.norm(vecs_real, axis=2, keepdims=True)
+        real_vecs = vecs_real / np.where(norms > 1e-10, norms, 1)
+        values_real = np.ascontiguousarray(eigenvalues.real)
+        determinants = np.asarray(determinants).tolist()
+        traces = np.asarray(traces).tolist()
+        
+        if not all(all_real):
+            values_imag = eigenvalues.imag.tolist()
+            vecs_imag = np.ascontiguousarray(eigenvectors.imag.transpose(0, 2, 1))
+        
+        results = []
+        for i, real_row in enumerate(all_real):
             result = {
-                'eigenvalues': [],
-                'eigenvectors': [],
-                'is_real': [],
-                'determinant': float(np.linalg.det(matrix)),
-                'trace': float(np.trace(matrix))
+                'eigenvalues': values_real[i],
+                'eigenvectors': real_vecs[i],
+                'is_real': is_real[i],
+                'determinant': determinants[i],
+                'trace': traces[i]
             }
             
-            for i, (val, vec) in enumerate(zip(eigenvalues, eigenvectors.T)):
-                # Check if eigenvalue is real (within numerical precision)
-                is_real = abs(val.imag) < 1e-10
-                
-                if is_real:
-                    # Real eigenvalue
-                    real_val = float(val.real)
-                    real_vec = [float(vec[0].real), float(vec[1].real)]
-                    
-                    # Normalize the eigenvector
-                    norm = np.linalg.norm(real_vec)
-                    if norm > 1e-10:
-                        real_vec = [x / norm for x in real_vec]
-                    
-                    result['eigenvalues'].append(real_val)
-                    result['eigenvectors'].append(real_vec)
-                    result['is_real'].append(True)
-                else:
-                    # Complex eigenvalue
-                    complex_val = {
-                        'real': float(val.real),
-                        'imag': float(val.imag)
-                    }
-                    complex_vec = {
-                        'real': [float(vec[0].real), float(vec[1].real)],
-                        'imag': [float(vec[0].imag), float(vec[1].imag)]
-                    }
-                    
-                    result['eigenvalues'].append(complex_val)
-                    result['eigenvectors'].append(complex_vec)
-                    result['is_real'].append(False)
-            
-            return result
+            if not real_row:
+                flags = is_real[i].tolist()
+                result['eigenvalues'] = [
+                    values_real[i, k] if real else
+                    {'real': values_real[i, k], 'imag': values_imag[i][k]}
+                    for k, real in enumerate(flags)
+                ]
+                result['eigenvectors'] = [
+                    real_vecs[i, k] if real else
+                    {'real': vecs_real[i, k], 'imag': vecs_imag[i, k]}
+                    for k, real in enumerate(flags)
+                ]
             
-        except Exception as e:
-            logger.error(f"Error calculating 2D eigenvalues: {str(e)}")
-            raise
+            results.append(result)
+        
+        return results
+    
+    @staticmethod
+    def calculate_eigenvalues_2d(matrix):
+        """
+        Calculate eigenvalues and eigenvectors for a 2x2 matrix
+        Returns both real and complex eigenvalues/eigenvectors, sorted by
+        descending real part
+
+        Uses the compiled closed-form kernel _eig2x2 instead of a LAPACK call.
+        """
+        matrix = np.ascontiguousarray(matrix, dtype=np.float64)
+        if matrix.shape != (2, 2):
+            raise ValueError("Matrix must be 2x2")
+        
+        a, b = float(matrix[0, 0]), float(matrix[0, 1])
+        c, d = float(matrix[1, 0]), float(matrix[1, 1])
+        (l1_re, l1_im, l2_re, l2_im,
+         v1x, v1y_re, v1y_im, v2x, v2y_re, v2y_im) = _eig2x2(a, b, c, d)
+        
+        is_real = abs(l1_im) <= IMAG_TOLERANCE * max(abs(a), abs(b), abs(c), abs(d))
+        if is_real:
+            # Real within numerical precision; report the normalized real
+            # parts, as _build_results does
+            n1 = math.hypot(v1x, v1y_re)
+            n2 = math.hypot(v2x, v2y_re)
+            eigenvalues = [l1_re, l2_re]
+            eigenvectors = [[v1x / n1, v1y_re / n1], [v2x / n2, v2y_re / n2]]
+        else:
+            # Complex conjugate pair
+            eigenvalues = [
+                {'real': l1_re, 'imag': l1_im},
+                {'real': l2_re, 'imag': l2_im}
+            ]
+            eigenvectors = [
+                {'real': [v1x, v1y_re], 'imag': [0.0, v1y_im]},
+                {'real': [v2x, v2y_re], 'imag': [0.0, v2y_im]}
+            ]
+        
+        result = {
+            'eigenvalues': eigenvalues,
+            'eigenvectors': eigenvectors,
+            'is_real': [is_real] * 2,
+            'determinant': a * d - b * c,
+            'trace': a + d
+        }
+        
+        return result
     
     @staticmethod
     def calculate_eigenvalues_3d(matrix):
         """
         Calculate eigenvalues and eigenvectors for a 3x3 matrix
+        Eigenvalues are sorted by descending real part
         """
-        try:
-            matrix = np.array(matrix, dtype=float)
-            if matrix.shape != (3, 3):
-                raise ValueError("Matrix must be 3x3")
-            
+        matrix = np.ascontiguousarray(matrix, dtype=np.float64)
+        if matrix.shape != (3, 3):
+            raise ValueError("Matrix must be 3x3")
+        
+        m = matrix.tolist()
+        if m[0][1] == m[1][0] and m[0][2] == m[2][0] and m[1][2] == m[2][1]:
+            # Symmetric driver (syevd): real eigenvalues in ascending order
+            # and orthonormal eigenvectors, so reversing is enough
+            eigenvalues, eigenvectors = np.linalg.eigh(matrix)
+            eigenvalues = eigenvalues[::-1]
+            eigenvectors = eigenvectors[:, ::-1]
+        else:
             eigenvalues, eigenvectors = np.linalg.eig(matrix)
-            
-            result = {
-                'eigenvalues': [],
-                'eigenvectors': [],
-                'is_real': [],
-                'determinant': float(np.linalg.det(matrix)),
-                'trace': float(np.trace(matrix))
-            }
-            
-            for i, (val, vec) in enumerate(zip(eigenvalues, eigenvectors.T)):
-                is_real = abs(val.imag) < 1e-10
-                
-                if is_real:
-                    real_val = float(val.real)
-                    real_vec = [float(vec[0].real), float(vec[1].real), float(vec[2].real)]
-                    
-                    # Normalize the eigenvector
-                    norm = np.linalg.norm(real_vec)
-                    if norm > 1e-10:
-                        real_vec = [x / norm for x in real_vec]
-                    
-                    result['eigenvalues'].append(real_val)
-                    result['eigenvectors'].append(real_vec)
-                    result['is_real'].append(True)
-                else:
-                    complex_val = {
-                        'real': float(val.real),
-                        'imag': float(val.imag)
-                    }
-                    complex_vec = {
-                        'real': [float(vec[0].real), float(vec[1].real), float(vec[2].real)],
-                        'imag': [float(vec[0].imag), float(vec[1].imag), float(vec[2].imag)]
-                    }
-                    
-                    result['eigenvalues'].append(complex_val)
-                    result['eigenvectors'].append(complex_vec)
-                    result['is_real'].append(False)
-            
-            return result
-            
-        except Exception as e:
-            logger.error(f"Error calculating 3D eigenvalues: {str(e)}")
-            raise
+            order = np.argsort(-eigenvalues.real, kind='stable')
+            eigenvalues = eigenvalues[order]
+            eigenvectors = eigenvectors[:, order]
+        
+        return EigenCalculator._build_results(
+            eigenvalues[np.newaxis],
+            eigenvectors[np.newaxis],
+            [EigenCalculator._det3x3(m)],
+            [m[0][0] + m[1][1] + m[2][2]],
+            [max(abs(x) for row in m for x in row)]
+        )[0]
+    
+    @staticmethod
+    def calculate_eigenvalues_batch(matrices, dim):
+        """
+        Calculate eigenvalues and eigenvectors for a stack of 2x2 or 3x3 matrices
+        The whole stack is decomposed with a single batched LAPACK call;
+        each result is sorted by descending real part
+        """
+        if dim not in (2, 3):
+            raise ValueError("Dimension must be 2 or 3")
+        
+        matrices = np.ascontiguousarray(matrices, dtype=np.float64)
+        if matrices.ndim != 3 or matrices.shape[1:] != (dim, dim):
+            raise ValueError(f"Matrices must be a list of {dim}x{dim} matrices")
+        
+        # Symmetric stacks can use the faster symmetric driver (syevd),
+        # which returns real eigenvalues and orthonormal eigenvectors
+        if np.array_equal(matrices, matrices.transpose(0, 2, 1)):
+            # eigh returns ascending eigenvalues, so reversing is enough
+            eigenvalues, eigenvectors = np.linalg.eigh(matrices)
+            eigenvalues = eigenvalues[:, ::-1]
+            eigenvectors = eigenvectors[:, :, ::-1]
+        else:
+            eigenvalues, eigenvectors = np.linalg.eig(matrices)
+            order = np.argsort(-eigenvalues.real, axis=1, kind='stable')
+            eigenvalues = np.take_along_axis(eigenvalues, order, axis=1)
+            eigenvectors = np.take_along_axis(eigenvectors, order[:, np.newaxis, :], axis=2)
+        determinants = np.linalg.det(matrices)
+        traces = np.trace(matrices, axis1=1, axis2=2)
+        scales = np.abs(matrices).max(axis=(1, 2))
+        
+        return EigenCalculator._build_results(
+            eigenvalues,
+            eigenvectors,
+            determinants,
+            traces,
+            scales
+        )
+    
+    @staticmethod
+    def _det3x3(m):
+        """Determinant of a 3x3 nested list by cofactor expansion (rule of Sarrus)"""
+        return (m[0][0] * (m[1][1] * m[2][2] - m[1][2] * m[2][1])
+                - m[0][1] * (m[1][0] * m[2][2] - m[1][2] * m[2][0])
+                + m[0][2] * (m[1][0] * m[2][1] - m[1][1] * m[2][0]))
     
     @staticmethod
     def transform_vector(matrix, vector):
         """
         Apply matrix transformation to a vector
         """
-        try:
-            matrix = np.array(matrix, dtype=float)
-            vector = np.array(vector, dtype=float)
-            
-            if len(matrix.shape) != 2 or matrix.shape[0] != matrix.shape[1]:
-                raise ValueError("Matrix must be square")
-            
-            if len(vector) != matrix.shape[1]:
-                raise ValueError("Vector dimension must match matrix size")
-            
-            transformed = np.dot(matrix, vector)
-            return transformed.tolist()
-            
-        except Exception as e:
-            logger.error(f"Error transforming vector: {str(e)}")
-            raise
+        matrix = np.ascontiguousarray(matrix, dtype=np.float64)
+        vector = np.ascontiguousarray(vector, dtype=np.float64)
+        
+        if len(matrix.shape) != 2 or matrix.shape[0] != matrix.shape[1]:
+            raise ValueError("Matrix must be square")
+        
+        if len(vector) != matrix.shape[1]:
+            raise ValueError("Vector dimension must match matrix size")
+        
+        transformed = np.dot(matrix, vector)
+        return transformed.tolist()
     
     @staticmethod
     def check_eigenvector_alignment(matrix, vector, tolerance=1e-6):
@@ -156,32 +306,120 @@ class EigenCalculator:
         Check if a vector is approximately an eigenvector of the matrix
         Returns eigenvalue if it is, None otherwise
         """
-        try:
-            matrix = np.array(matrix, dtype=float)
-            vector = np.array(vector, dtype=float)
-            
-            # Normalize the vector
-            norm = np.linalg.norm(vector)
-            if norm < tolerance:
-                return None
-            
-            normalized_vector = vector / norm
-            transformed = np.dot(matrix, normalized_vector)
-            
-            # Check if transformed vector is parallel to original
-            # This means Av = λv for some scalar λ
-            cross_product_magnitude = np.linalg.norm(np.cross(normalized_vector, transformed))
-            
-            if cross_product_magnitude < tolerance:
-                # Vectors are parallel, find the eigenvalue
-                eigenvalue = np.dot(transformed, normalized_vector)
-                return float(eigenvalue)
-            
-            return None
-            
-        except Exception as e:
-            logger.error(f"Error checking eigenvector alignment: {str(e)}")
+        matrix = np.ascontiguousarray(matrix, dtype=np.float64)
+        vector = np.ascontiguousarray(vector, dtype=np.float64)
+        
+        # Normalize the vector
+        norm = math.hypot(*vector)
+        if norm < tolerance:
             return None
+        
+        normalized_vector = vector / norm
+        transformed = matrix @ normalized_vector
+        
+        # Check if transformed vector is parallel to original
+        # This means Av = λv with λ = v·Av, so the residual Av - λv vanishes
+        eigenvalue = normalized_vector @ transformed
+        residual = transformed - eigenvalue * normalized_vector
+        
+        if np.dot(residual, residual) < tolerance ** 2:
+            return float(eigenvalue)
+        
+        return None
+
+# Batches larger than this are decomposed in a worker process so the request
+# thread is not tied up in LAPACK
+POOL_THRESHOLD_BYTES = 512 * 512 * 8
+# Larger batches are rejected outright
+MAX_BATCH_SIZE = 100000
+POOL_TIMEOUT = 5
+# Pool processes per server worker; each re-imports NumPy, Numba and Flask, and
+# gunicorn already runs one server worker per CPU
+EIG_POOL_WORKERS = int(os.environ.get('EIG_POOL_WORKERS', 1))
+
+_eig_pool = None
+_eig_pool_lock = threading.Lock()
+
+def _warm_up():
+    """No-op task; unpickling it makes a pool process import this module"""
+
+def get_eig_pool():
+    """
+    Shared process pool for large decompositions, created on first use so
+    forked server workers do not each start one at import time
+    """
+    global _eig_pool
+    with _eig_pool_lock:
+        if _eig_pool is None:
+            # Forking a multi-threaded server worker can copy held locks into
+            # the child, so start pool processes from a clean forkserver
+            pool = concurrent.futures.ProcessPoolExecutor(
+                max_workers=EIG_POOL_WORKERS,
+                mp_context=multiprocessing.get_context('forkserver')
+            )
+            # Pay process start-up and imports here rather than inside the
+            # first request's POOL_TIMEOUT
+            warm_ups = [pool.submit(_warm_up) for _ in range(EIG_POOL_WORKERS)]
+            concurrent.futures.wait(warm_ups)
+            _eig_pool = pool
+        return _eig_pool
+
+def _retire_eig_pool(pool):
+    """
+    Stop handing out a pool whose task overran; its processes exit once their
+    current tasks, including other requests' batches, have finished
+    """
+    global _eig_pool
+    with _eig_pool_lock:
+        if _eig_pool is pool:
+            _eig_pool = None
+    pool.shutdown(wait=False)
+
+def run_in_eig_pool(func, *args):
+    """
+    Run func in the shared pool, raising concurrent.futures.TimeoutError if it
+    does not finish within POOL_TIMEOUT
+    """
+    pool = get_eig_pool()
+    future = pool.submit(func, *args)
+    try:
+        return future.result(timeout=POOL_TIMEOUT)
+    except concurrent.futures.TimeoutError:
+        if not future.cancel():
+            _retire_eig_pool(pool)
+        raise
+
+@functools.lru_cache(maxsize=1024)
+def _cached_eigen_json(calculate, shape, data):
+    matrix = np.frombuffer(data, dtype=np.float64).reshape(shape)
+    return orjson.dumps(calculate(matrix), option=ORJSON_OPTIONS)
+
+def eigen_json(calculate, matrix):
+    """
+    Run an EigenCalculator method through an LRU cache keyed by the matrix
+    shape and bytes, returning the serialized JSON body
+    """
+    matrix = np.ascontiguousarray(matrix, dtype=np.float64)
+    return _cached_eigen_json(calculate, matrix.shape, matrix.tobytes())
+
+# Validation error bodies are encoded once. A fresh Response is still needed per
+# request because after_request hooks (CORS) add headers to it
+ERR_MATRIX_REQUIRED = orjson.dumps({'error': 'Matrix is required'})
+ERR_MATRICES_REQUIRED = orjson.dumps({'error': 'Matrices and dim are required'})
+ERR_BATCH_TOO_LARGE = orjson.dumps({'error': f'At most {MAX_BATCH_SIZE} matrices per batch'})
+ERR_MATRIX_VECTOR_REQUIRED = orjson.dumps({'error': 'Matrix and vector are required'})
+
+def bad_request(body):
+    """Wrap a pre-encoded JSON error body in a 400 response"""
+    return Response(body, status=400, mimetype='application/json')
+
+def batch_json(matrices, dim):
+    """
+    Serialized batch results; encoding inside the pool process means only
+    bytes travel back to the request thread
+    """
+    results = EigenCalculator.calculate_eigenvalues_batch(matrices, dim)
+    return orjson.dumps({'results': results}, option=ORJSON_OPTIONS)
 
 @app.route('/api/health', methods=['GET'])
 def health_check():
@@ -196,10 +434,10 @@ def calculate_eigenvalues_2d():
         matrix = data.get('matrix')
         
         if not matrix:
-            return jsonify({'error': 'Matrix is required'}), 400
+            return bad_request(ERR_MATRIX_REQUIRED)
         
-        result = EigenCalculator.calculate_eigenvalues_2d(matrix)
-        return jsonify(result)
+        body = eigen_json(EigenCalculator.calculate_eigenvalues_2d, matrix)
+        return Response(body, mimetype='application/json')
         
     except Exception as e:
         logger.error(f"Error in 2D eigenvalue calculation: {str(e)}")
@@ -213,15 +451,44 @@ def calculate_eigenvalues_3d():
         matrix = data.get('matrix')
         
         if not matrix:
-            return jsonify({'error': 'Matrix is required'}), 400
+            return bad_request(ERR_MATRIX_REQUIRED)
         
-        result = EigenCalculator.calculate_eigenvalues_3d(matrix)
-        return jsonify(result)
+        body = eigen_json(EigenCalculator.calculate_eigenvalues_3d, matrix)
+        return Response(body, mimetype='application/json')
         
     except Exception as e:
         logger.error(f"Error in 3D eigenvalue calculation: {str(e)}")
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/eigenvalues/batch', methods=['POST'])
+def calculate_eigenvalues_batch():
+    """Calculate eigenvalues and eigenvectors for a batch of 2D or 3D matrices"""
+    try:
+        data = request.get_json()
+        matrices = data.get('matrices')
+        dim = data.get('dim')
+        
+        if not matrices or dim is None:
+            return bad_request(ERR_MATRICES_REQUIRED)
+        
+        if len(matrices) > MAX_BATCH_SIZE:
+            return bad_request(ERR_BATCH_TOO_LARGE)
+        
+        matrices = np.ascontiguousarray(matrices, dtype=np.float64)
+        if matrices.nbytes > POOL_THRESHOLD_BYTES:
+            body = run_in_eig_pool(batch_json, matrices, dim)
+        else:
+            body = batch_json(matrices, dim)
+        return Response(body, mimetype='application/json')
+        
+    except concurrent.futures.TimeoutError:
+        logger.error(f"Batch eigenvalue calculation timed out after {POOL_TIMEOUT}s")
+        return jsonify({'error': f'Batch calculation timed out after {POOL_TIMEOUT} seconds'}), 504
+        
+    except Exception as e:
+        logger.error(f"Error in batch eigenvalue calculation: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
 @app.route('/api/transform', methods=['POST'])
 def transform_vector():
     """Apply matrix transformation to a vector"""
@@ -231,7 +498,7 @@ def transform_vector():
         vector = data.get('vector')
         
         if not matrix or not vector:
-            return jsonify({'error': 'Matrix and vector are required'}), 400
+            return bad_request(ERR_MATRIX_VECTOR_REQUIRED)
         
         result = EigenCalculator.transform_vector(matrix, vector)
         return jsonify({'transformed_vector': result})
@@ -250,7 +517,7 @@ def check_eigenvector():
         tolerance = data.get('tolerance', 1e-6)
         
         if not matrix or not vector:
-            return jsonify({'error': 'Matrix and vector are required'}), 400
+            return bad_request(ERR_MATRIX_VECTOR_REQUIRED)
         
         eigenvalue = EigenCalculator.check_eigenvector_alignment(matrix, vector, tolerance)
         
@@ -265,61 +532,78 @@ def check_eigenvector():
         logger.error(f"Error checking eigenvector: {str(e)}")
         return jsonify({'error': str(e)}), 500
 
+# Presets are static, so encode them once at import time
+_PRESETS = {
+    '2d': [
+        {
+            'name': 'Identity Matrix',
+            'matrix': [[1, 0], [0, 1]],
+            'description': 'All vectors are eigenvectors with eigenvalue 1'
+        },
+        {
+            'name': 'Scaling Matrix',
+            'matrix': [[2, 0], [0, 3]],
+            'description': 'Diagonal matrix with eigenvalues 2 and 3'
+        },
+        {
+            'name': 'Reflection Matrix',
+            'matrix': [[1, 0], [0, -1]],
+            'description': 'Reflects across x-axis, eigenvalues 1 and -1'
+        },
+        {
+            'name': 'Rotation Matrix (90°)',
+            'matrix': [[0, -1], [1, 0]],
+            'description': 'Pure rotation, complex eigenvalues'
+        },
+        {
+            'name': 'Shear Matrix',
+            'matrix': [[1, 1], [0, 1]],
+            'description': 'Shear transformation, repeated eigenvalue 1'
+        },
+        {
+            'name': 'Symmetric Matrix',
+            'matrix': [[3, 1], [1, 3]],
+            'description': 'Real eigenvalues 2 and 4'
+        }
+    ],
+    '3d': [
+        {
+            'name': '3D Identity',
+            'matrix': [[1, 0, 0], [0, 1, 0], [0, 0, 1]],
+            'description': 'All vectors are eigenvectors'
+        },
+        {
+            'name': '3D Scaling',
+            'matrix': [[2, 0, 0], [0, 3, 0], [0, 0, 4]],
+            'description': 'Eigenvalues 2, 3, 4'
+        },
+        {
+            'name': 'Rotation about Z-axis',
+            'matrix': [[0, -1, 0], [1, 0, 0], [0, 0, 1]],
+            'description': 'Real eigenvalue 1, complex pair'
+        }
+    ]
+}
+_PRESETS_BODY = orjson.dumps(_PRESETS, option=ORJSON_OPTIONS)
+_PRESETS_ETAG = hashlib.sha1(_PRESETS_BODY).hexdigest()
+_PRESETS_NOT_MODIFIED_HEADERS = {
+    'Cache-Control': 'public, max-age=86400',
+    'ETag': f'"{_PRESETS_ETAG}"'
+}
+_PRESETS_HEADERS = {
+    **_PRESETS_NOT_MODIFIED_HEADERS,
+    'Content-Type': 'application/json',
+    'Content-Length': str(len(_PRESETS_BODY))
+}
+
 @app.route('/api/matrix-presets', methods=['GET'])
 def get_matrix_presets():
     """Get predefined matrices with known eigenvalues for educational purposes"""
-    presets = {
-        '2d': [
-            {
-                'name': 'Identity Matrix',
-                'matrix': [[1, 0], [0, 1]],
-                'description': 'All vectors are eigenvectors with eigenvalue 1'
-            },
-            {
-                'name': 'Scaling Matrix',
-                'matrix': [[2, 0], [0, 3]],
-                'description': 'Diagonal matrix with eigenvalues 2 and 3'
-            },
-            {
-                'name': 'Reflection Matrix',
-                'matrix': [[1, 0], [0, -1]],
-                'description': 'Reflects across x-axis, eigenvalues 1 and -1'
-            },
-            {
-                'name': 'Rotation Matrix (90°)',
-                'matrix': [[0, -1], [1, 0]],
-                'description': 'Pure rotation, complex eigenvalues'
-            },
-            {
-                'name': 'Shear Matrix',
-                'matrix': [[1, 1], [0, 1]],
-                'description': 'Shear transformation, repeated eigenvalue 1'
-            },
-            {
-                'name': 'Symmetric Matrix',
-                'matrix': [[3, 1], [1, 3]],
-                'description': 'Real eigenvalues 2 and 4'
-            }
-        ],
-        '3d': [
-            {
-                'name': '3D Identity',
-                'matrix': [[1, 0, 0], [0, 1, 0], [0, 0, 1]],
-                'description': 'All vectors are eigenvectors'
-            },
-            {
-                'name': '3D Scaling',
-                'matrix': [[2, 0, 0], [0, 3, 0], [0, 0, 4]],
-                'description': 'Eigenvalues 2, 3, 4'
-            },
-            {
-                'name': 'Rotation about Z-axis',
-                'matrix': [[0, -1, 0], [1, 0, 0], [0, 0, 1]],
-                'description': 'Real eigenvalue 1, complex pair'
-            }
-        ]
-    }
-    return jsonify(presets)
+    # after_request hooks (CORS) add headers to the response, so a single
+    # shared Response object cannot be reused; only its parts are prebuilt
+    if request.if_none_match.contains(_PRESETS_ETAG):
+        return Response(status=304, headers=_PRESETS_NOT_MODIFIED_HEADERS)
+    return Response(_PRESETS_BODY, headers=_PRESETS_HEADERS)
 
 @app.route('/')
 def serve_frontend():
@@ -0,0 +1,212 @@
+import numpy as np
+import pytest
+
+from app import EigenCalculator
+
+
+@pytest.mark.parametrize('a', [0.1, 0.3, -1.7, 2.5])
+@pytest.mark.parametrize('off', [1.0, 2.0, -0.37, 1e-3])
+@pytest.mark.parametrize('lower', [True, False])
+def test_2d_triangular_equal_diagonal_is_real(a, off, lower):
+    """Shear-like matrices have a repeated real eigenvalue equal to the diagonal"""
+    matrix = [[a, 0.0], [off, a]] if lower else [[a, off], [0.0, a]]
+    result = EigenCalculator.calculate_eigenvalues_2d(matrix)
+    
+    assert result['is_real'] == [True, True]
+    assert result['eigenvalues'] == pytest.approx([a, a])
+    for vec in result['eigenvectors']:
+        v = np.array(vec)
+        assert np.linalg.norm(v) == pytest.approx(1.0)
+        assert np.allclose(np.array(matrix) @ v, a * v)
+
+
+def test_2d_triangular_random_family_is_real():
+    rng = np.random.default_rng(0)
+    for a, off in rng.normal(size=(2000, 2)):
+        for matrix in ([[a, 0.0], [off, a]], [[a, off], [0.0, a]]):
+            result = EigenCalculator.calculate_eigenvalues_2d(matrix)
+            assert result['is_real'] == [True, True]
+
+
+@pytest.mark.parametrize('eps', [1e-9, 1e-8, 1e-6])
+def test_2d_nearly_repeated_eigenvalues(eps):
+    """Close eigenvalues must not lose their split to cancellation"""
+    result = EigenCalculator.calculate_eigenvalues_2d([[1.0, eps], [eps, 1.0]])
+    
+    assert result['is_real'] == [True, True]
+    l1, l2 = result['eigenvalues']
+    assert l1 - l2 == pytest.approx(2 * eps, rel=1e-6)
+    inv_sqrt2 = 1 / np.sqrt(2)
+    assert np.allclose(np.abs(result['eigenvectors'][0]), [inv_sqrt2, inv_sqrt2])
+    assert np.allclose(np.abs(result['eigenvectors'][1]), [inv_sqrt2, inv_sqrt2])
+    assert np.dot(result['eigenvectors'][0], result['eigenvectors'][1]) == pytest.approx(0, abs=1e-9)
+
+
+def test_2d_matches_numpy_on_random_matrices():
+    rng = np.random.default_rng(1)
+    for matrix in rng.normal(size=(500, 2, 2)):
+        result = EigenCalculator.calculate_eigenvalues_2d(matrix)
+        for val, vec, is_real in zip(result['eigenvalues'], result['eigenvectors'], result['is_real']):
+            if is_real:
+                lam, v = val, np.array(vec)
+            else:
+                lam = val['real'] + 1j * val['imag']
+                v = np.array(vec['real']) + 1j * np.array(vec['imag'])
+            assert np.allclose(matrix @ v, lam * v, atol=1e-10)
+        expected = np.sort_complex(np.linalg.eigvals(matrix))
+        actual = np.sort_complex([
+            v if r else v['real'] + 1j * v['imag']
+            for v, r in zip(result['eigenvalues'], result['is_real'])
+        ])
+        assert np.allclose(actual, expected)
+
+
+def test_batch_pool_timeout_returns_504(monkeypatch):
+    import app as backend
+    
+    monkeypatch.setattr(backend, 'POOL_THRESHOLD_BYTES', 0)
+    monkeypatch.setattr(backend, 'POOL_TIMEOUT', 0)
+    client = backend.app.test_client()
+    response = client.post('/api/eigenvalues/batch', json={
+        'dim': 2,
+        'matrices': [[[2, 1], [1, 2]]] * 1000
+    })
+    
+    assert response.status_code == 504
+    assert 'timed out' in response.get_json()['error']
+
+
+def test_retired_pool_finishes_running_batches():
+    import time
+    import app as backend
+    
+    pool = backend.get_eig_pool()
+    running = pool.submit(time.sleep, 0.2)
+    backend._retire_eig_pool(pool)
+    
+    assert running.result(timeout=5) is None
+    assert backend._eig_pool is None
+    assert backend.get_eig_pool() is not pool
+
+
+def test_batch_nearly_symmetric_uses_general_solver():
+    """eigh reads one triangle only, so slightly asymmetric input must not reach it"""
+    matrix = [[1.0, 2.0], [2.00001, 1.0]]
+    result = EigenCalculator.calculate_eigenvalues_batch([matrix], 2)[0]
+    
+    expected = np.sort(np.linalg.eigvals(np.array(matrix)))[::-1]
+    assert np.allclose(result['eigenvalues'], expected, rtol=0, atol=1e-12)
+
+
+def test_3d_nearly_symmetric_uses_general_solver():
+    matrix = [[1.0, 2.0, 0.0], [2.00001, 1.0, 0.0], [0.0, 0.0, 3.0]]
+    result = EigenCalculator.calculate_eigenvalues_3d(matrix)
+    
+    expected = np.sort(np.linalg.eigvals(np.array(matrix)).real)[::-1]
+    assert np.allclose(result['eigenvalues'], expected, rtol=0, atol=1e-12)
+
+
+def _check_3d_symmetric(matrix, result):
+    matrix = np.asarray(matrix, dtype=np.float64)
+    eigenvalues = np.asarray(result['eigenvalues'])
+    eigenvectors = np.asarray(result['eigenvectors'])
+    
+    assert all(result['is_real'])
+    assert np.allclose(eigenvalues, np.linalg.eigvalsh(matrix)[::-1], rtol=0, atol=1e-12)
+    assert np.allclose(eigenvectors @ eigenvectors.T, np.eye(3), atol=1e-12)
+    for val, vec in zip(eigenvalues, eigenvectors):
+        assert np.allclose(matrix @ vec, val * vec, rtol=0, atol=1e-12)
+
+
+def test_3d_random_symmetric():
+    rng = np.random.default_rng(2)
+    for _ in range(200):
+        matrix = rng.normal(size=(3, 3))
+        matrix = matrix + matrix.T
+        _check_3d_symmetric(matrix, EigenCalculator.calculate_eigenvalues_3d(matrix))
+
+
+@pytest.mark.parametrize('spectrum', [
+    [1.0, 1.0, 1.0],
+    [2.0, 2.0, -1.0],
+    [3.0, 1.0, 1.0],
+    [1.0, 1e-8, 0.0],
+    [1.0 + 1e-9, 1.0 - 1e-9, 3.0],
+])
+def test_3d_repeated_and_near_repeated_spectra(spectrum):
+    rng = np.random.default_rng(3)
+    q, _ = np.linalg.qr(rng.normal(size=(3, 3)))
+    matrix = q @ np.diag(spectrum) @ q.T
+    matrix = (matrix + matrix.T) / 2
+    _check_3d_symmetric(matrix, EigenCalculator.calculate_eigenvalues_3d(matrix))
+
+
+def test_3d_near_repeated_keeps_eigenvectors():
+    result = EigenCalculator.calculate_eigenvalues_3d([[1, 1e-9, 0], [1e-9, 1, 0], [0, 0, 3]])
+    
+    assert result['eigenvalues'][1] - result['eigenvalues'][2] == pytest.approx(2e-9, rel=1e-6)
+    inv_sqrt2 = 1 / np.sqrt(2)
+    assert np.allclose(np.abs(result['eigenvectors'][1]), [inv_sqrt2, inv_sqrt2, 0])
+    assert np.allclose(np.abs(result['eigenvectors'][2]), [inv_sqrt2, inv_sqrt2, 0])
+
+
+def test_3d_tiny_rotation_is_not_treated_as_symmetric():
+    scale = 1e-13
+    matrix = [[0, -scale, 0], [scale, 0, 0], [0, 0, scale]]
+    result = EigenCalculator.calculate_eigenvalues_3d(matrix)
+    
+    assert list(result['is_real']).count(False) == 2
+
+
+def test_2d_tiny_rotation_stays_complex():
+    result = EigenCalculator.calculate_eigenvalues_2d([[0, -1e-13], [1e-13, 0]])
+    
+    assert result['is_real'] == [False, False]
+    assert result['eigenvalues'][0]['imag'] == pytest.approx(1e-13)
+
+
+def test_batch_tiny_rotation_is_not_treated_as_symmetric():
+    result = EigenCalculator.calculate_eigenvalues_batch([[[0, -1e-13], [1e-13, 0]]], 2)[0]
+    
+    assert list(result['is_real']) == [False, False]
+    assert abs(result['eigenvalues'][0]['imag']) == pytest.approx(1e-13)
+
+
+def test_batch_mixed_real_and_complex_matches_single():
+    matrices = [[[0, -1], [1, 0]], [[3, 1], [1, 3]], [[1, 2], [3, 4]]]
+    results = EigenCalculator.calculate_eigenvalues_batch(matrices, 2)
+    
+    for matrix, result in zip(matrices, results):
+        single = EigenCalculator.calculate_eigenvalues_2d(matrix)
+        assert list(result['is_real']) == single['is_real']
+        for val, vec, is_real in zip(result['eigenvalues'], result['eigenvectors'], result['is_real']):
+            if is_real:
+                lam, v = val, np.asarray(vec)
+            else:
+                lam = val['real'] + 1j * val['imag']
+                v = np.asarray(vec['real']) + 1j * np.asarray(vec['imag'])
+            assert np.allclose(np.array(matrix) @ v, lam * v)
+
+
+def test_batch_rejects_oversized_input(monkeypatch):
+    import app as backend
+    
+    monkeypatch.setattr(backend, 'MAX_BATCH_SIZE', 2)
+    client = backend.app.test_client()
+    response = client.post('/api/eigenvalues/batch', json={
+        'dim': 2,
+        'matrices': [[[1, 0], [0, 1]]] * 3
+    })
+    
+    assert response.status_code == 400
+
+
+def test_json_provider_honours_sort_keys_and_indent():
+    import app as backend
+    
+    provider = backend.app.json
+    obj = {'b': np.float64(1.0), 'a': [1, 2]}
+    
+    assert provider.dumps(obj) == '{"a":[1,2],"b":1.0}'
+    assert provider.dumps(obj, sort_keys=False) == '{"b":1.0,"a":[1,2]}'
+    assert provider.dumps(obj, indent=2) == '{\n  "a": [\n    1,\n    2\n  ],\n  "b": 1.0\n}'
@@ -7,18 +7,50 @@ import sys
 import os
 import subprocess
 
+# BLAS threading must be configured before NumPy is first imported. The
+# backend only decomposes 2x2/3x3 matrices, where thread start-up and barrier
+# costs outweigh any parallel speedup, and gunicorn already runs one worker
+# per CPU, so keep OpenBLAS single-threaded unless overridden.
+os.environ.setdefault('OPENBLAS_NUM_THREADS', '1')
+
 def check_dependencies():
     """Check if required Python packages are installed"""
     try:
         import numpy
         import flask
         import flask_cors
+        import gunicorn
         print("✅ All Python dependencies are available")
         return True
     except ImportError as e:
         print(f"❌ Missing dependency: {e}")
         return False
 
+def available_cpus():
+    """Count the CPUs this process may run on, honouring affinity limits"""
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+def make_server(app, options):
+    """Wrap the Flask app in a programmatic gunicorn server"""
+    from gunicorn.app.base import BaseApplication
+    
+    class GunicornApplication(BaseApplication):
+        def __init__(self, application, options):
+            self.application = application
+            self.options = options
+            super().__init__()
+        
+        def load_config(self):
+            for key, value in self.options.items():
+                self.cfg.set(key, value)
+        
+        def load(self):
+            return self.application
+    
+    return GunicornApplication(app, options)
+
 def start_app():
     """Start the Flask application"""
     if not check_dependencies():
@@ -34,9 +66,19 @@ def start_app():
     
     # Get port from environment (Render sets this automatically)
     port = int(os.environ.get('PORT', 5000))
+    workers = int(os.environ.get('WEB_CONCURRENCY', available_cpus()))
+    
+    # NumPy releases the GIL inside LAPACK, so threads scale for concurrent
+    # requests while worker processes cover the pure-Python paths
+    options = {
+        'bind': f'0.0.0.0:{port}',
+        'workers': workers,
+        'worker_class': 'gthread',
+        'threads': 4,
+    }
     
-    print(f"🚀 Starting Linalgovistool on port {port}")
-    app.run(host='0.0.0.0', port=port, debug=False)
+    print(f"🚀 Starting Linalgovistool on port {port} with {workers} workers")
+    make_server(app, options).run()
 
 if __name__ == "__main__":
     start_app()